@@ -5,21 +5,37 @@ Creates a signed JWT and exchanges it for an access token.
 """
 
 import base64
+import functools
 import json
 import os
 import time
 import urllib.request
 import urllib.parse
 
-import jwt
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
 
 
 TOKEN_URI = "https://oauth2.googleapis.com/token"
 CALENDAR_SCOPE = "https://www.googleapis.com/auth/calendar.readonly"
 
+# The JWT header is constant, so its base64url form is precomputed.
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"RS256","typ":"JWT"}').rstrip(b"=")
 
+# Parsed RSA key cache; PEM/ASN.1 parsing only needs to happen once per container.
+_PRIVATE_KEY = None
+
+# Access token cache, reused across warm Lambda invocations.
+_TOKEN_CACHE = {"token": None, "exp": 0.0}
+
+
+@functools.lru_cache(maxsize=1)
 def get_service_account_credentials() -> dict:
-    """Load service account credentials from base64-encoded env var."""
+    """Load service account credentials from base64-encoded env var.
+
+    Cached for the container lifetime; the env var never changes between
+    invocations, so the base64 + JSON decode only needs to run once.
+    """
     encoded = os.environ.get("GOOGLE_SERVICE_ACCOUNT_JSON_B64")
     if not encoded:
         raise ValueError("GOOGLE_SERVICE_ACCOUNT_JSON_B64 not set")
@@ -28,8 +44,19 @@ def get_service_account_credentials() -> dict:
     return json.loads(decoded)
 
 
+def _load_private_key(pem: str):
+    """Load and cache the service account's RSA private key."""
+    global _PRIVATE_KEY
+    if _PRIVATE_KEY is None:
+        _PRIVATE_KEY = serialization.load_pem_private_key(
+            pem.encode("utf-8"),
+            password=None,
+        )
+    return _PRIVATE_KEY
+
+
 def create_signed_jwt(credentials: dict, scope: str) -> str:
-    """Create a signed JWT for Google OAuth2."""
+    """Create a signed RS256 JWT for Google OAuth2."""
     now = int(time.time())
 
     payload = {
@@ -40,15 +67,19 @@ def create_signed_jwt(credentials: dict, scope: str) -> str:
         "exp": now + 3600,  # 1 hour expiry
     }
 
-    return jwt.encode(
-        payload,
-        credentials["private_key"],
-        algorithm="RS256",
-    )
+    payload_b64 = base64.urlsafe_b64encode(
+        json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    ).rstrip(b"=")
+
+    signing_input = _JWT_HEADER_B64 + b"." + payload_b64
+    key = _load_private_key(credentials["private_key"])
+    signature = key.sign(signing_input, padding.PKCS1v15(), hashes.SHA256())
+
+    return (signing_input + b"." + base64.urlsafe_b64encode(signature).rstrip(b"=")).decode("ascii")
 
 
-def exchange_jwt_for_access_token(signed_jwt: str) -> str:
-    """Exchange signed JWT for an access token."""
+def exchange_jwt_for_access_token(signed_jwt: str) -> tuple[str, int]:
+    """Exchange signed JWT for an access token and its lifetime in seconds."""
     data = urllib.parse.urlencode({
         "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
         "assertion": signed_jwt,
@@ -59,11 +90,21 @@ def exchange_jwt_for_access_token(signed_jwt: str) -> str:
 
     with urllib.request.urlopen(req, timeout=30) as response:
         result = json.loads(response.read().decode("utf-8"))
-        return result["access_token"]
+        return result["access_token"], int(result.get("expires_in", 3600))
 
 
 def get_access_token() -> str:
-    """Get a valid access token for Google Calendar API."""
+    """Get a valid access token for Google Calendar API.
+
+    Tokens are cached at module scope so warm Lambda containers skip the
+    RSA signing and token exchange round trip until the token expires.
+    """
+    if _TOKEN_CACHE["token"] and time.time() < _TOKEN_CACHE["exp"] - 60:
+        return _TOKEN_CACHE["token"]
+
     credentials = get_service_account_credentials()
     signed_jwt = create_signed_jwt(credentials, CALENDAR_SCOPE)
-    return exchange_jwt_for_access_token(signed_jwt)
+    token, expires_in = exchange_jwt_for_access_token(signed_jwt)
+    _TOKEN_CACHE["token"] = token
+    _TOKEN_CACHE["exp"] = time.time() + expires_in
+    return token
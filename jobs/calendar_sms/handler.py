@@ -4,14 +4,40 @@ Google Calendar SMS job.
 Fetches today's calendar events and sends SMS summary via AWS SNS.
 """
 
-import json
 import os
 import urllib.request
 import urllib.parse
 from datetime import datetime, timedelta, timezone
 
+try:
+    from orjson import loads as json_loads  # vendored; 2-5x faster on bytes
+except ImportError:
+    from json import loads as json_loads
+
 from google_auth import get_access_token
 
+# EST offset for "today" calculations, built once instead of per event.
+_EST = timezone(timedelta(hours=-5))
+
+
+def _build_sns_client():
+    """Build the SNS client with bounded timeouts and retries."""
+    import boto3
+    from botocore.config import Config
+
+    return boto3.client(
+        "sns",
+        config=Config(retries={"max_attempts": 2}, connect_timeout=3, read_timeout=5),
+    )
+
+
+# SNS client cache, reused across warm Lambda invocations. Under provisioned
+# concurrency the init phase isn't billed, so build the client eagerly there;
+# on-demand deployments keep the lazy build to stay off the cold-start path.
+_SNS = None
+if os.environ.get("AWS_LAMBDA_INITIALIZATION_TYPE") == "provisioned-concurrency":
+    _SNS = _build_sns_client()
+
 
 def main(event, context):
     """Lambda handler - fetch calendar events and send SMS."""
@@ -57,8 +83,7 @@ def fetch_todays_events(calendar_id: str) -> list:
 
     # Get today's date range in UTC
     # Using EST timezone offset (-5 hours) to get "today" in EST
-    est_offset = timezone(timedelta(hours=-5))
-    now_est = datetime.now(est_offset)
+    now_est = datetime.now(_EST)
     today_start = now_est.replace(hour=0, minute=0, second=0, microsecond=0)
     today_end = today_start + timedelta(days=1)
 
@@ -80,44 +105,46 @@ def fetch_todays_events(calendar_id: str) -> list:
     req.add_header("Authorization", f"Bearer {access_token}")
 
     with urllib.request.urlopen(req, timeout=30) as response:
-        data = json.loads(response.read().decode("utf-8"))
+        data = json_loads(response.read())
         return data.get("items", [])
 
 
 def format_events_for_sms(events: list) -> str:
     """Format calendar events into SMS-friendly text."""
-    today = datetime.now(timezone(timedelta(hours=-5))).strftime("%a %b %d")
+    today = datetime.now(_EST).strftime("%a %b %d")
 
     if not events:
         return f"📅 {today}\nNo events scheduled."
 
-    lines = [f"📅 {today}"]
+    def lines():
+        yield f"📅 {today}"
 
-    for event in events:
-        summary = event.get("summary", "Untitled")
+        for event in events:
+            summary = event.get("summary", "Untitled")
 
-        # Handle all-day events vs timed events
-        start = event.get("start", {})
-        if "dateTime" in start:
-            # Timed event - parse and format time in EST
-            start_dt = datetime.fromisoformat(start["dateTime"])
-            est_offset = timezone(timedelta(hours=-5))
-            start_est = start_dt.astimezone(est_offset)
-            time_str = start_est.strftime("%-I:%M%p").lower()
-            lines.append(f"• {time_str} {summary}")
-        else:
-            # All-day event
-            lines.append(f"• (all day) {summary}")
+            # Handle all-day events vs timed events
+            start = event.get("start", {})
+            if "dateTime" in start:
+                # Timed event - parse and format time in EST
+                start_dt = datetime.fromisoformat(start["dateTime"])
+                start_est = start_dt.astimezone(_EST)
+                time_str = start_est.strftime("%-I:%M%p").lower()
+                yield f"• {time_str} {summary}"
+            else:
+                # All-day event
+                yield f"• (all day) {summary}"
 
-    return "\n".join(lines)
+    return "\n".join(lines())
 
 
 def send_sms(phone_number: str, message: str) -> None:
     """Send SMS via AWS SNS."""
-    import boto3
+    global _SNS
+
+    if _SNS is None:
+        _SNS = _build_sns_client()
 
-    sns = boto3.client("sns")
-    sns.publish(
+    _SNS.publish(
         PhoneNumber=phone_number,
         Message=message,
     )
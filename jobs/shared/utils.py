@@ -9,6 +9,24 @@ import json
 import urllib.request
 from typing import Optional
 
+import urllib3
+
+try:
+    from orjson import loads as json_loads  # vendored; 2-5x faster on bytes
+except ImportError:
+    from json import loads as json_loads
+
+# Shared connection pool so back-to-back requests to the same host reuse the
+# TCP+TLS connection. urllib3 ships with the Lambda Python runtime via botocore.
+_HTTP = urllib3.PoolManager(
+    maxsize=4,
+    timeout=urllib3.Timeout(connect=3, read=10),
+    retries=urllib3.Retry(total=2, backoff_factor=0.2),
+)
+
+# Cap response bodies so an oversized page can't exhaust Lambda memory.
+MAX_RESPONSE_BYTES = 2_000_000
+
 
 def fetch_url(url: str, timeout: int = 30) -> str:
     """
@@ -16,17 +34,37 @@ def fetch_url(url: str, timeout: int = 30) -> str:
 
     Args:
         url: The URL to fetch
-        timeout: Request timeout in seconds
+        timeout: Read timeout in seconds
 
     Returns:
-        Response body as string
+        Response body as string (at most MAX_RESPONSE_BYTES after decompression)
+
+    Raises:
+        RuntimeError: If the server returns an error status or the response
+            body exceeds MAX_RESPONSE_BYTES
     """
-    req = urllib.request.Request(
+    response = _HTTP.request(
+        "GET",
         url,
-        headers={"User-Agent": "Mozilla/5.0 (compatible; CronBot/1.0)"},
+        headers={
+            "User-Agent": "Mozilla/5.0 (compatible; CronBot/1.0)",
+            "Accept-Encoding": "gzip",
+        },
+        timeout=urllib3.Timeout(connect=3, read=timeout),
+        preload_content=False,
     )
-    with urllib.request.urlopen(req, timeout=timeout) as response:
-        return response.read().decode("utf-8")
+    try:
+        # urllib3 doesn't raise on 4xx/5xx like urlopen did; don't hand an
+        # error page back to callers as if it were content.
+        if response.status >= 400:
+            raise RuntimeError(f"HTTP {response.status} from {url}")
+        data = response.read(MAX_RESPONSE_BYTES + 1, decode_content=True)
+        if len(data) > MAX_RESPONSE_BYTES:
+            raise RuntimeError(f"Response from {url} exceeds {MAX_RESPONSE_BYTES} bytes")
+    finally:
+        response.release_conn()
+
+    return data.decode("utf-8", errors="replace")
 
 
 def call_llm(
@@ -67,7 +105,7 @@ def call_llm(
 
     try:
         with urllib.request.urlopen(req, timeout=60) as response:
-            result = json.loads(response.read().decode("utf-8"))
+            result = json_loads(response.read())
             return result["choices"][0]["message"]["content"]
     except Exception as e:
         print(f"LLM API error: {e}")